@@ -6,127 +6,220 @@ Generates realistic sensor data for model training and testing
 
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime
 import json
 
+FEATURE_COLUMNS = ['soil_moisture', 'temperature', 'humidity', 'audio_energy']
+FEATURE_MIN = np.array([0, 10, 0, 0], dtype=np.float32)
+FEATURE_MAX = np.array([100, 50, 100, 1], dtype=np.float32)
+
+# Training dataset parameters, one row per class (Normal, WaterStress, PestRisk):
+# normal mean/std of (soil_moisture, temperature, humidity) and audio_energy range
+_CLASS_NORMAL_MU = np.array([[50, 25, 65], [25, 35, 35], [45, 28, 55]], dtype=np.float32)
+_CLASS_NORMAL_SIG = np.array([[8, 2, 10], [6, 3, 8], [12, 4, 15]], dtype=np.float32)
+_CLASS_AUDIO_LO = np.array([0, 0.1, 0.6], dtype=np.float32)
+_CLASS_AUDIO_HI = np.array([0.3, 0.4, 0.9], dtype=np.float32)
+
+# Real-time sample parameters, one row per condition (Normal, WaterStress, PestRisk):
+# normal mean/std of (soil_moisture, temperature, humidity) and audio_energy range
+_REALTIME_CLASS_PROBS = np.array([0.6, 0.2, 0.2])
+_REALTIME_CLASS_CDF = np.cumsum(_REALTIME_CLASS_PROBS)
+_REALTIME_MU = np.array([[50, 25, 65], [20, 35, 30], [45, 28, 55]], dtype=np.float32)
+_REALTIME_SIGMA = np.array([[5, 1.5, 5], [4, 2, 4], [6, 2, 8]], dtype=np.float32)
+_REALTIME_AUDIO_LO = np.array([0, 0.1, 0.7], dtype=np.float32)
+_REALTIME_AUDIO_HI = np.array([0.2, 0.3, 0.9], dtype=np.float32)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 class FarmDataGenerator:
     def __init__(self, seed=42):
-        self.rng = np.random.default_rng(seed)
+        self.seed = seed
+        self.rng = np.random.Generator(np.random.SFC64(seed))
         self.class_names = ['Normal', 'WaterStress', 'PestRisk']
         
-    def generate_normal_conditions(self, num_samples):
+        # Pre-drawn variates for single real-time samples, refilled lazily
+        self._pool_size = 4096
+        self._pool_idx = 0
+        self._pool = None
+        self._unif_pool = None
+        
+    def dataset_fingerprint(self):
+        """Describe what determines generate_complete_dataset output from a fresh generator"""
+        return repr((
+            _CLASS_NORMAL_MU.tolist(), _CLASS_NORMAL_SIG.tolist(),
+            _CLASS_AUDIO_LO.tolist(), _CLASS_AUDIO_HI.tolist(),
+            FEATURE_MIN.tolist(), FEATURE_MAX.tolist(),
+            type(self.rng.bit_generator).__name__, self.seed
+        ))
+    
+    def _normal(self, mu, sigma, size):
+        """Draw float32 normal variates (Generator.normal only returns float64)"""
+        return self.rng.standard_normal(size, dtype=np.float32) * sigma + mu
+    
+    def _uniform(self, low, high, size):
+        """Draw float32 uniform variates on [low, high)"""
+        return self.rng.random(size, dtype=np.float32) * (high - low) + low
+    
+    def _generate_class(self, k, num_samples, out=None, out_labels=None):
+        """Generate samples for class k from the module-level parameter tables"""
+        if out is None:
+            out = np.empty((num_samples, 4), dtype=np.float32)
+        if out_labels is None:
+            out_labels = np.empty(num_samples, dtype=np.int8)
+        out[:, :3] = self._normal(_CLASS_NORMAL_MU[k], _CLASS_NORMAL_SIG[k], (num_samples, 3))
+        out[:, 3] = self._uniform(_CLASS_AUDIO_LO[k], _CLASS_AUDIO_HI[k], num_samples)
+        out_labels.fill(k)
+        return out, out_labels
+    
+    def generate_normal_conditions(self, num_samples, out=None, out_labels=None):
         """Generate data for normal, healthy crop conditions"""
-        data = {
-            'soil_moisture': self.rng.normal(50, 8, num_samples),
-            'temperature': self.rng.normal(25, 2, num_samples),
-            'humidity': self.rng.normal(65, 10, num_samples),
-            'audio_energy': self.rng.uniform(0, 0.3, num_samples)
-        }
-        return pd.DataFrame(data), np.zeros(num_samples, dtype=int)
+        return self._generate_class(0, num_samples, out, out_labels)
     
-    def generate_water_stress(self, num_samples):
+    def generate_water_stress(self, num_samples, out=None, out_labels=None):
         """Generate data for water stress conditions"""
-        data = {
-            'soil_moisture': self.rng.normal(25, 6, num_samples),
-            'temperature': self.rng.normal(35, 3, num_samples),
-            'humidity': self.rng.normal(35, 8, num_samples),
-            'audio_energy': self.rng.uniform(0.1, 0.4, num_samples)
-        }
-        return pd.DataFrame(data), np.ones(num_samples, dtype=int)
+        return self._generate_class(1, num_samples, out, out_labels)
     
-    def generate_pest_risk(self, num_samples):
+    def generate_pest_risk(self, num_samples, out=None, out_labels=None):
         """Generate data for pest risk conditions"""
-        data = {
-            'soil_moisture': self.rng.normal(45, 12, num_samples),
-            'temperature': self.rng.normal(28, 4, num_samples),
-            'humidity': self.rng.normal(55, 15, num_samples),
-            'audio_energy': self.rng.uniform(0.6, 0.9, num_samples)
-        }
-        return pd.DataFrame(data), np.ones(num_samples, dtype=int) * 2
+        return self._generate_class(2, num_samples, out, out_labels)
     
     def generate_complete_dataset(self, samples_per_class=1000):
-        """Generate complete balanced dataset"""
+        """Generate complete balanced dataset
+        
+        Returns a (3N, 4) float32 feature array with columns in FEATURE_COLUMNS
+        order, the (3N,) labels and a (3N,) datetime64 timestamp array.
+        """
         print(" Generating synthetic farm dataset...")
         
-        # Generate data for each class
-        df_normal, labels_normal = self.generate_normal_conditions(samples_per_class)
-        df_water, labels_water = self.generate_water_stress(samples_per_class)
-        df_pest, labels_pest = self.generate_pest_risk(samples_per_class)
+        N = samples_per_class
+        features = np.empty((3 * N, 4), dtype=np.float32)
+        labels = np.empty(3 * N, dtype=np.int8)
         
-        # Combine all data
-        df = pd.concat([df_normal, df_water, df_pest], ignore_index=True)
-        labels = np.concatenate([labels_normal, labels_water, labels_pest])
+        # Generate data for each class directly into its slice of the buffers
+        self.generate_normal_conditions(N, features[0:N], labels[0:N])
+        self.generate_water_stress(N, features[N:2 * N], labels[N:2 * N])
+        self.generate_pest_risk(N, features[2 * N:3 * N], labels[2 * N:3 * N])
         
         # Add some realistic constraints
-        df['soil_moisture'] = np.clip(df['soil_moisture'], 0, 100)
-        df['temperature'] = np.clip(df['temperature'], 10, 50)
-        df['humidity'] = np.clip(df['humidity'], 0, 100)
-        df['audio_energy'] = np.clip(df['audio_energy'], 0, 1)
+        np.clip(features, FEATURE_MIN, FEATURE_MAX, out=features)
         
         # Add timestamp for time series data
-        base_time = datetime.now()
-        timestamps = [base_time - timedelta(hours=i) for i in range(len(df))]
-        df['timestamp'] = timestamps
+        base_time = np.datetime64(datetime.now())
+        timestamps = base_time - np.arange(3 * N) * np.timedelta64(1, 'h')
         
-        print(f" Generated {len(df)} samples")
+        print(f" Generated {len(features)} samples")
         print(f"   Class distribution: Normal={np.sum(labels==0)}, "
               f"WaterStress={np.sum(labels==1)}, PestRisk={np.sum(labels==2)}")
         
-        return df, labels
+        return features, labels, timestamps
+    
+    def _refill_pool(self):
+        """Draw a fresh pool of standard normal and uniform variates"""
+        self._pool = self.rng.standard_normal((self._pool_size, 3), dtype=np.float32)
+        self._unif_pool = self.rng.random((self._pool_size, 2), dtype=np.float32)
+        self._pool_idx = 0
+    
+    def _next_pool_sample(self):
+        """Build a single real-time sample from the next row of the pools"""
+        if self._pool is None or self._pool_idx >= self._pool_size:
+            self._refill_pool()
+        
+        z = self._pool[self._pool_idx]
+        u = self._unif_pool[self._pool_idx]
+        self._pool_idx += 1
+        
+        # Choose the condition and scale the variates by its parameters
+        condition_type = int(np.searchsorted(_REALTIME_CLASS_CDF, u[0], side='right'))
+        soil_moisture, temperature, humidity = np.clip(
+            _REALTIME_MU[condition_type] + _REALTIME_SIGMA[condition_type] * z,
+            FEATURE_MIN[:3], FEATURE_MAX[:3]
+        ).tolist()
+        lo = _REALTIME_AUDIO_LO[condition_type]
+        hi = _REALTIME_AUDIO_HI[condition_type]
+        audio_energy = float(min(1, max(0, lo + (hi - lo) * u[1])))
+        
+        return {
+            'soil_moisture': soil_moisture,
+            'temperature': temperature,
+            'humidity': humidity,
+            'audio_energy': audio_energy,
+            'condition': condition_type
+        }
     
     def generate_real_time_samples(self, num_samples=10):
         """Generate real-time samples for simulation"""
-        conditions = []
-        
-        for i in range(num_samples):
-            # Randomly choose a condition to simulate
-            condition_type = self.rng.choice([0, 1, 2], p=[0.6, 0.2, 0.2])
-            
-            if condition_type == 0:  # Normal
-                sample = {
-                    'soil_moisture': self.rng.normal(50, 5),
-                    'temperature': self.rng.normal(25, 1.5),
-                    'humidity': self.rng.normal(65, 5),
-                    'audio_energy': self.rng.uniform(0, 0.2)
-                }
-            elif condition_type == 1:  # Water stress
-                sample = {
-                    'soil_moisture': self.rng.normal(20, 4),
-                    'temperature': self.rng.normal(35, 2),
-                    'humidity': self.rng.normal(30, 4),
-                    'audio_energy': self.rng.uniform(0.1, 0.3)
-                }
-            else:  # Pest risk
-                sample = {
-                    'soil_moisture': self.rng.normal(45, 6),
-                    'temperature': self.rng.normal(28, 2),
-                    'humidity': self.rng.normal(55, 8),
-                    'audio_energy': self.rng.uniform(0.7, 0.9)
-                }
-            
-            # Apply constraints
-            sample['soil_moisture'] = max(0, min(100, sample['soil_moisture']))
-            sample['temperature'] = max(10, min(50, sample['temperature']))
-            sample['humidity'] = max(0, min(100, sample['humidity']))
-            sample['audio_energy'] = max(0, min(1, sample['audio_energy']))
-            sample['condition'] = condition_type
-            
-            conditions.append(sample)
+        # Single samples (the simulation loop) are served from pre-drawn pools
+        if num_samples == 1:
+            return [self._next_pool_sample()]
+        
+        # Randomly choose a condition to simulate for every sample at once
+        condition_type = self.rng.choice([0, 1, 2], size=num_samples, p=_REALTIME_CLASS_PROBS)
+        
+        # Per-condition parameters, indexed by condition
+        soil_moisture = self._normal(_REALTIME_MU[condition_type, 0],
+                                     _REALTIME_SIGMA[condition_type, 0], num_samples)
+        temperature = self._normal(_REALTIME_MU[condition_type, 1],
+                                   _REALTIME_SIGMA[condition_type, 1], num_samples)
+        humidity = self._normal(_REALTIME_MU[condition_type, 2],
+                                _REALTIME_SIGMA[condition_type, 2], num_samples)
+        audio_energy = self._uniform(_REALTIME_AUDIO_LO[condition_type],
+                                     _REALTIME_AUDIO_HI[condition_type], num_samples)
+        
+        # Apply constraints
+        np.clip(soil_moisture, 0, 100, out=soil_moisture)
+        np.clip(temperature, 10, 50, out=temperature)
+        np.clip(humidity, 0, 100, out=humidity)
+        np.clip(audio_energy, 0, 1, out=audio_energy)
+        
+        conditions = [
+            {
+                'soil_moisture': sm,
+                'temperature': t,
+                'humidity': h,
+                'audio_energy': a,
+                'condition': c
+            }
+            for sm, t, h, a, c in zip(soil_moisture.tolist(), temperature.tolist(),
+                                      humidity.tolist(), audio_energy.tolist(),
+                                      condition_type.tolist())
+        ]
         
         return conditions
     
-    def save_dataset(self, df, labels, filename='synthetic_farm_data.csv'):
-        """Save dataset to CSV file"""
+    def to_dataframe(self, features, labels, timestamps):
+        """Wrap generated arrays in a labelled DataFrame"""
+        df = pd.DataFrame(features, columns=FEATURE_COLUMNS)
+        df['timestamp'] = timestamps
         df['label'] = labels
         df['condition'] = df['label'].map({0: 'Normal', 1: 'WaterStress', 2: 'PestRisk'})
+        return df
+    
+    def save_dataset(self, features, labels, timestamps, filename='synthetic_farm_data.csv'):
+        """Save dataset to CSV file"""
+        df = self.to_dataframe(features, labels, timestamps)
         
         df.to_csv(filename, index=False)
         print(f" Dataset saved to {filename}")
         
-        # Also save as JSON for web dashboard
-        json_data = df.to_dict('records')
-        with open(filename.replace('.csv', '.json'), 'w') as f:
-            json.dump(json_data, f, indent=2, default=str)
+        # Also save as JSON for web dashboard, built straight from the arrays
+        columns = {name: features[:, i].tolist() for i, name in enumerate(FEATURE_COLUMNS)}
+        # Same "YYYY-MM-DD HH:MM:SS.ffffff" form that str() gives pandas Timestamps
+        columns['timestamp'] = pd.DatetimeIndex(timestamps).astype(str).tolist()
+        columns['label'] = np.asarray(labels).tolist()
+        columns['condition'] = np.array(self.class_names)[labels].tolist()
+        json_data = [dict(zip(columns, row)) for row in zip(*columns.values())]
+        
+        json_filename = filename.replace('.csv', '.json')
+        if ORJSON_AVAILABLE:
+            with open(json_filename, 'wb') as f:
+                f.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_filename, 'w') as f:
+                json.dump(json_data, f, indent=2)
         
         return filename
 
@@ -135,10 +228,11 @@ def main():
     generator = FarmDataGenerator(seed=42)
     
     # Generate complete dataset
-    df, labels = generator.generate_complete_dataset(samples_per_class=1000)
+    features, labels, timestamps = generator.generate_complete_dataset(samples_per_class=1000)
     
     # Save to file
-    filename = generator.save_dataset(df, labels)
+    filename = generator.save_dataset(features, labels, timestamps)
+    df = generator.to_dataframe(features, labels, timestamps)
     
     # Print sample statistics
     print("\n Dataset Statistics:")
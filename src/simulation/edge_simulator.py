@@ -5,26 +5,89 @@ Simulates the complete edge inference pipeline for testing
 """
 
 import numpy as np
+import pandas as pd
 import tensorflow as tf
 import time
 import json
+import os
+import hashlib
+import sys
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from data_generator import FarmDataGenerator
 
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
+
+# Trained dummy-model weights are cached here, keyed by architecture and training setup.
+# Set KRISHIRAKSHAK_CACHE_DIR to move the cache, or to an empty string (or set
+# MODEL_CACHE_DIR to None) to disable it.
+MODEL_CACHE_DIR = os.environ.get(
+    'KRISHIRAKSHAK_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'krishirakshak')
+) or None
+
+ALERT_CLASS_NAMES = np.array(['Normal', 'Water Stress', 'Pest Risk'])
+# Indexed by decide_alerts status code: predicted class when confident, else 3
+ALERT_STATUS = np.array([" Normal", " ALERT: Water Stress", " ALERT: Pest Risk",
+                         " Low confidence"])
+
+# Per-process simulator used by benchmark_performance_parallel workers
+_worker_simulator = None
+
+def _init_benchmark_worker(model_path, seed, batch_size):
+    """Build and warm up the worker's simulator (and its TF model) once per process"""
+    global _worker_simulator
+    # One TF thread per worker so cpu_count workers do not oversubscribe the cores
+    tf.config.threading.set_intra_op_parallelism_threads(1)
+    tf.config.threading.set_inter_op_parallelism_threads(1)
+    _worker_simulator = EdgeInferenceSimulator(model_path, seed=seed)
+    
+    # Untimed batch-shaped call so chunks with a single batch are not timed cold
+    _worker_simulator.model(np.zeros((batch_size, 4), dtype=np.float32), training=False)
+
+def _run_benchmark_chunk(num_iterations, seed, batch_size):
+    """Run a batched benchmark chunk in a worker and return raw ns timings"""
+    simulator = _worker_simulator
+    simulator.generator = FarmDataGenerator(seed=seed)
+    simulator.reset_inference_times()
+    simulator.run_batched_inference(num_iterations, batch_size)
+    return simulator.inference_times[:simulator.num_inferences].copy()
+
 class EdgeInferenceSimulator:
-    def __init__(self, model_path=None):
-        self.generator = FarmDataGenerator()
+    def __init__(self, model_path=None, seed=42):
+        self.seed = seed
+        self.model_path = model_path
+        self.generator = FarmDataGenerator(seed=seed)
         self.model = None
         self.interpreter = None
-        self.inference_times = []
+        self.inference_times = np.empty(1024, dtype=np.int64)  # Raw ns
+        self.reset_inference_times()
+        self._buf = np.empty((1, 4), dtype=np.float32)
+        
+        # Wall-clock anchor for result timestamps, which are stored as
+        # perf_counter_ns offsets and only formatted when reported
+        self._start_wall = datetime.now()
+        self._start_ns = time.perf_counter_ns()
         
         if model_path:
             self.load_model(model_path)
         else:
             self.create_dummy_model()
     
-    def create_dummy_model(self):
-        """Create a simple model for simulation"""
+    def create_dummy_model(self, samples_per_class=100, epochs=10):
+        """Create a simple model for simulation
+        
+        Unless MODEL_CACHE_DIR is None, the trained weights are cached on disk
+        and reused by later simulators with the same architecture, training
+        data, compile settings and TF/Keras version. The training data always
+        comes from a freshly seeded generator, so the generator's seed and
+        parameter tables identify it exactly.
+        """
         print(" Creating dummy ML model for simulation...")
         
         self.model = tf.keras.Sequential([
@@ -35,31 +98,193 @@ class EdgeInferenceSimulator:
             tf.keras.layers.Dense(3, activation='softmax')
         ])
         
-        self.model.compile(optimizer='adam', 
-                          loss='sparse_categorical_crossentropy', 
-                          metrics=['accuracy'])
+        compile_settings = {
+            'optimizer': 'adam',
+            'loss': 'sparse_categorical_crossentropy',
+            'metrics': ['accuracy']
+        }
+        self.model.compile(**compile_settings)
+        
+        # Draw the training data from a fresh generator, also on a cache hit,
+        # and continue sampling from it so later samples never depend on
+        # whether the weights came from the cache
+        self.generator = FarmDataGenerator(seed=self.generator.seed)
+        X, y, _ = self.generator.generate_complete_dataset(samples_per_class)
         
-        # Generate some dummy data for demonstration
-        X, y = self.generator.generate_complete_dataset(100)
-        self.model.fit(X[['soil_moisture', 'temperature', 'humidity', 'audio_energy']].values, 
-                      y, epochs=10, verbose=0)
+        weights_path = None
+        if MODEL_CACHE_DIR is not None:
+            architecture = [
+                (type(layer).__name__,
+                 {k: v for k, v in layer.get_config().items() if k != 'name'})
+                for layer in self.model.layers
+            ]
+            key = hashlib.sha256(repr((
+                architecture, compile_settings, self.generator.dataset_fingerprint(),
+                samples_per_class, epochs,
+                tf.__version__, getattr(tf.keras, '__version__', '')
+            )).encode()).hexdigest()
+            weights_path = os.path.join(MODEL_CACHE_DIR, f"dummy_{key}.weights.h5")
         
-        print(" Dummy model created and trained")
+        if weights_path and os.path.exists(weights_path):
+            self.model.load_weights(weights_path)
+            print(f" Dummy model loaded from cache ({weights_path})")
+        else:
+            self.model.fit(X, y, epochs=epochs, verbose=0)
+            
+            if weights_path:
+                # Write to a temp file and rename so concurrent simulators
+                # never load a partially written weights file
+                os.makedirs(MODEL_CACHE_DIR, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=MODEL_CACHE_DIR, suffix='.weights.h5')
+                os.close(fd)
+                try:
+                    self.model.save_weights(tmp_path)
+                    os.replace(tmp_path, weights_path)
+                except BaseException:
+                    os.remove(tmp_path)
+                    raise
+            print(" Dummy model created and trained")
+        
+        self.build_inference_function()
     
     def load_model(self, model_path):
         """Load a pre-trained TensorFlow model"""
         print(f" Loading model from {model_path}...")
         self.model = tf.keras.models.load_model(model_path)
         print(" Model loaded successfully")
+        
+        self.build_inference_function()
+    
+    def build_inference_function(self):
+        """Trace a fixed-shape graph for single-sample inference
+        
+        model.predict builds a tf.data pipeline and callbacks on every call,
+        which for a model this small costs 10-50x the forward pass itself.
+        The traced graph avoids that; models that cannot be traced with a
+        fixed (1, 4) signature fall back to the lighter predict_on_batch.
+        
+        Called whenever self.model is replaced. Any TFLite interpreter was
+        converted from the previous model, so it is dropped as well.
+        """
+        self.interpreter = None
+        
+        traced = tf.function(
+            lambda x: self.model(x, training=False),
+            input_signature=[tf.TensorSpec([1, 4], tf.float32)]
+        )
+        
+        try:
+            # Warm up once so the first real inference does not pay for tracing
+            traced(tf.zeros([1, 4], tf.float32))
+            self._infer = lambda x: traced(tf.constant(x, dtype=tf.float32)).numpy()
+        except (TypeError, ValueError) as e:
+            print(f" Could not trace model ({e}), using predict_on_batch")
+            self._infer = self.model.predict_on_batch
+    
+    def convert_to_tflite_int8(self, rep_dataset=None):
+        """Quantize the model to INT8 TFLite and use it for edge inference"""
+        print(" Converting model to TFLite INT8...")
+        
+        if rep_dataset is None:
+            # ~100 calibration samples spread across all classes
+            features, _, _ = self.generator.generate_complete_dataset(34)
+            rep_dataset = self.normalize_features(features)
+        
+        def representative_dataset():
+            for sample in rep_dataset:
+                yield [np.asarray(sample, dtype=np.float32).reshape(1, 4)]
+        
+        converter = tf.lite.TFLiteConverter.from_keras_model(self.model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        tflite_model = converter.convert()
+        
+        self.interpreter = tf.lite.Interpreter(model_content=tflite_model, num_threads=1)
+        self.interpreter.allocate_tensors()
+        self.input_index = self.interpreter.get_input_details()[0]['index']
+        self.output_index = self.interpreter.get_output_details()[0]['index']
+        
+        print(f" TFLite INT8 model ready ({len(tflite_model) / 1024:.1f} KB)")
+        return tflite_model
+    
+    def reserve_inference_times(self, count):
+        """Make room for `count` more timings without growing mid-run"""
+        required = self.num_inferences + count
+        if required > len(self.inference_times):
+            grown = np.empty(max(required, 2 * len(self.inference_times)), dtype=np.int64)
+            grown[:self.num_inferences] = self.inference_times[:self.num_inferences]
+            self.inference_times = grown
+    
+    def reset_inference_times(self):
+        """Forget recorded timings and their running statistics"""
+        self.num_inferences = 0
+        self._time_mean = 0.0            # Running mean (ns)
+        self._time_m2 = 0.0              # Running sum of squared deviations (ns^2)
+        self._time_min = float('inf')
+        self._time_max = float('-inf')
+    
+    def record_inference_time(self, elapsed_ns):
+        """Store a single raw inference timing in nanoseconds (per-call fast path)"""
+        i = self.num_inferences
+        if i == len(self.inference_times):
+            self.reserve_inference_times(1)
+        self.inference_times[i] = elapsed_ns
+        
+        # Welford update of the running mean/variance, plus min/max
+        n = i + 1
+        delta = elapsed_ns - self._time_mean
+        self._time_mean += delta / n
+        self._time_m2 += delta * (elapsed_ns - self._time_mean)
+        if elapsed_ns < self._time_min:
+            self._time_min = elapsed_ns
+        if elapsed_ns > self._time_max:
+            self._time_max = elapsed_ns
+        self.num_inferences = n
+    
+    def record_inference_times(self, times_ns):
+        """Store a batch of raw inference timings in nanoseconds"""
+        times_ns = np.atleast_1d(times_ns)
+        count = len(times_ns)
+        if count == 0:
+            return
+        self.reserve_inference_times(count)
+        self.inference_times[self.num_inferences:self.num_inferences + count] = times_ns
+        
+        # Merge into the running mean/variance (Chan et al.) and min/max
+        batch_mean = float(times_ns.mean())
+        batch_m2 = float(((times_ns - batch_mean) ** 2).sum()) if count > 1 else 0.0
+        total = self.num_inferences + count
+        delta = batch_mean - self._time_mean
+        self._time_mean += delta * count / total
+        self._time_m2 += batch_m2 + delta * delta * self.num_inferences * count / total
+        self._time_min = min(self._time_min, float(times_ns.min()))
+        self._time_max = max(self._time_max, float(times_ns.max()))
+        self.num_inferences = total
+    
+    def get_inference_times_ms(self):
+        """Return recorded inference timings converted to milliseconds"""
+        return self.inference_times[:self.num_inferences] / 1e6
+    
+    def get_inference_stats(self):
+        """Return mean/std/min/max of recorded timings in ms without rescanning them"""
+        if self.num_inferences == 0:
+            nan = float('nan')
+            return {'mean': nan, 'std': nan, 'min': nan, 'max': nan}
+        return {
+            'mean': self._time_mean / 1e6,
+            'std': (self._time_m2 / self.num_inferences) ** 0.5 / 1e6,
+            'min': self._time_min / 1e6,
+            'max': self._time_max / 1e6
+        }
     
     def preprocess_sensor_data(self, sensor_data):
         """Preprocess sensor data for ML inference"""
-        features = np.array([
-            sensor_data['soil_moisture'] / 100.0,      # Normalize to 0-1
-            (sensor_data['temperature'] - 10) / 40.0,  # Normalize 10-50°C to 0-1
-            sensor_data['humidity'] / 100.0,           # Normalize to 0-1
-            sensor_data['audio_energy']                # Already 0-1
-        ]).reshape(1, -1)
+        features = self._buf
+        features[0, 0] = sensor_data['soil_moisture'] / 100.0      # Normalize to 0-1
+        features[0, 1] = (sensor_data['temperature'] - 10) / 40.0  # Normalize 10-50°C to 0-1
+        features[0, 2] = sensor_data['humidity'] / 100.0           # Normalize to 0-1
+        features[0, 3] = sensor_data['audio_energy']               # Already 0-1
         
         return features
     
@@ -72,11 +297,17 @@ class EdgeInferenceSimulator:
         features = self.preprocess_sensor_data(sensor_data)
         
         # Run inference with timing
-        start_time = time.time()
-        predictions = self.model.predict(features, verbose=0)
-        inference_time = (time.time() - start_time) * 1000  # Convert to ms
+        start_ns = time.perf_counter_ns()
+        if self.interpreter is not None:
+            self.interpreter.set_tensor(self.input_index, features)
+            self.interpreter.invoke()
+            predictions = self.interpreter.get_tensor(self.output_index)
+        else:
+            predictions = self._infer(features)
+        elapsed_ns = time.perf_counter_ns() - start_ns
         
-        self.inference_times.append(inference_time)
+        self.record_inference_time(elapsed_ns)
+        inference_time = elapsed_ns / 1e6  # Convert to ms
         
         # Get results
         predicted_class = np.argmax(predictions[0])
@@ -87,56 +318,131 @@ class EdgeInferenceSimulator:
             'confidence': float(confidence),
             'inference_time_ms': float(inference_time),
             'raw_predictions': predictions[0].tolist(),
-            'timestamp': datetime.now().isoformat()
+            'timestamp_offset_ns': start_ns - self._start_ns
         }
         
         return result
     
-    def simulate_real_time_operation(self, duration_minutes=10, sample_interval_sec=30):
-        """Simulate real-time edge device operation"""
-        print(f" Starting real-time simulation for {duration_minutes} minutes...")
-        print(f"   Sample interval: {sample_interval_sec} seconds")
-        print("-" * 60)
+    def decide_alerts(self, predictions, confidence_threshold=0.7):
+        """Vectorized edge decision logic over an (N, 3) batch of predictions
+        
+        Returns the predicted classes, their confidences, a status code per
+        sample (the class when confident, 3 for low confidence) and the mask
+        of samples that raise an alert (confident and not Normal).
+        """
+        predicted_class = predictions.argmax(axis=1)
+        confidence = predictions[np.arange(len(predictions)), predicted_class]
+        confident = confidence > confidence_threshold
+        status_code = np.where(confident, predicted_class, 3)
+        alert_mask = confident & (predicted_class != 0)
+        return predicted_class, confidence, status_code, alert_mask
+    
+    def format_sample_result(self, sample_result, total_samples, time_str):
+        """Format one simulated sample as the multi-line console block"""
+        sensors = sample_result['sensors']
+        return (
+            f"Sample {sample_result['sample']}/{total_samples} "
+            f"[{time_str}]:\n"
+            f"  Sensors: Moisture={sensors['soil_moisture']:.1f}%, "
+            f"Temp={sensors['temperature']:.1f}°C, "
+            f"Humidity={sensors['humidity']:.1f}%, "
+            f"Audio={sensors['audio_energy']:.2f}\n"
+            f"  Prediction: {ALERT_CLASS_NAMES[sample_result['predicted_class']]} "
+            f"({sample_result['confidence']:.1%})\n"
+            f"  Inference: {sample_result['inference_time_ms']:.2f} ms\n"
+            f"  Status: {sample_result['status']}\n"
+            + "-" * 40 + "\n"
+        )
+    
+    def build_sample_result(self, index, timestamp_offset_ns, sensors, predicted_class,
+                            confidence, inference_time_ms, status_code):
+        """Collect one simulated sample's outcome into a result dict"""
+        return {
+            'sample': index + 1,
+            'timestamp_offset_ns': timestamp_offset_ns,
+            'sensors': sensors,
+            'predicted_class': int(predicted_class),
+            'confidence': float(confidence),
+            'inference_time_ms': float(inference_time_ms),
+            'status': str(ALERT_STATUS[status_code])
+        }
+    
+    def simulate_real_time_operation(self, duration_minutes=10, sample_interval_sec=30,
+                                     realtime=True, verbose=1):
+        """Simulate real-time edge device operation
+        
+        Every sample goes through run_inference, so timings are single-sample
+        latencies from whichever backend is active (Keras or TFLite). With
+        realtime=False samples are not paced and only the logged timestamp
+        advances, so the run measures inference rather than sleep.
+        
+        verbose=0 prints nothing, 1 prints the summary only and 2 also prints
+        every sample (as it happens when realtime, in one write otherwise).
+        Returns the per-sample results as a list of dicts. Their simulated
+        timestamps are kept as nanosecond offsets like run_inference results,
+        so they can be passed straight to save_simulation_report.
+        """
+        if verbose:
+            print(f" Starting real-time simulation for {duration_minutes} minutes...")
+            print(f"   Sample interval: {sample_interval_sec} seconds")
+            print("-" * 60)
         
         total_samples = (duration_minutes * 60) // sample_interval_sec
-        alerts_sent = 0
+        self.reserve_inference_times(total_samples)
+        base_offset_ns = time.perf_counter_ns() - self._start_ns
+        interval_ns = int(round(sample_interval_sec * 1e9))
+        
+        sensor_samples = []
+        predictions = np.empty((total_samples, 3), dtype=np.float32)
+        inference_times_ms = np.empty(total_samples)
         
         for i in range(total_samples):
-            # Generate realistic sensor data
-            sensor_sample = self.generator.generate_real_time_samples(1)[0]
+            # Generate realistic sensor data and run inference
+            sensor_samples.append(self.generator.generate_real_time_samples(1)[0])
+            result = self.run_inference(sensor_samples[i])
+            predictions[i] = result['raw_predictions']
+            inference_times_ms[i] = result['inference_time_ms']
             
-            # Run inference
-            result = self.run_inference(sensor_sample)
-            
-            # Decision logic (simulating edge device behavior)
-            confidence_threshold = 0.7
-            if result['confidence'] > confidence_threshold:
-                alert_type = ['Normal', 'Water Stress', 'Pest Risk'][result['predicted_class']]
-                if result['predicted_class'] != 0:  # Don't alert for normal conditions
-                    alerts_sent += 1
-                    alert_status = f" ALERT: {alert_type}"
-                else:
-                    alert_status = " Normal"
-            else:
-                alert_status = " Low confidence"
-            
-            # Print results
-            print(f"Sample {i+1}/{total_samples}:")
-            print(f"  Sensors: Moisture={sensor_sample['soil_moisture']:.1f}%, "
-                  f"Temp={sensor_sample['temperature']:.1f}°C, "
-                  f"Humidity={sensor_sample['humidity']:.1f}%, "
-                  f"Audio={sensor_sample['audio_energy']:.2f}")
-            print(f"  Prediction: {['Normal', 'Water Stress', 'Pest Risk'][result['predicted_class']]} "
-                  f"({result['confidence']:.1%})")
-            print(f"  Inference: {result['inference_time_ms']:.2f} ms")
-            print(f"  Status: {alert_status}")
-            print("-" * 40)
-            
-            # Simulate delay between samples
-            time.sleep(sample_interval_sec)
+            if realtime:
+                if verbose >= 2:
+                    # Decide this sample on its own so it can be shown live
+                    predicted_class, confidence, status_code, _ = \
+                        self.decide_alerts(predictions[i:i + 1])
+                    sample_result = self.build_sample_result(
+                        i, base_offset_ns + i * interval_ns,
+                        sensor_samples[i], predicted_class[0], confidence[0],
+                        inference_times_ms[i], status_code[0]
+                    )
+                    time_str = self.format_offsets([sample_result['timestamp_offset_ns']])[0]
+                    sys.stdout.write(self.format_sample_result(sample_result, total_samples, time_str))
+                    sys.stdout.flush()
+                
+                # Simulate delay between samples
+                time.sleep(sample_interval_sec)
+        
+        # Decision logic (simulating edge device behavior) over all samples at once
+        predicted_class, confidence, status_code, alert_mask = self.decide_alerts(predictions)
+        results = [
+            self.build_sample_result(
+                i, base_offset_ns + i * interval_ns,
+                sensor_samples[i], predicted_class[i], confidence[i],
+                inference_times_ms[i], status_code[i]
+            )
+            for i in range(total_samples)
+        ]
+        
+        if not realtime and verbose >= 2:
+            time_strs = self.format_offsets([r['timestamp_offset_ns'] for r in results])
+            sys.stdout.write("".join(
+                self.format_sample_result(r, total_samples, ts)
+                for r, ts in zip(results, time_strs)
+            ))
         
         # Print simulation summary
-        self.print_simulation_summary(total_samples, alerts_sent)
+        if verbose:
+            self.print_simulation_summary(total_samples, int(alert_mask.sum()))
+        
+        return results
     
     def print_simulation_summary(self, total_samples, alerts_sent):
         """Print simulation performance summary"""
@@ -144,13 +450,14 @@ class EdgeInferenceSimulator:
         print("=" * 50)
         print(f"Total samples processed: {total_samples}")
         print(f"Alerts generated: {alerts_sent}")
-        print(f"Average inference time: {np.mean(self.inference_times):.2f} ms")
-        print(f"Max inference time: {np.max(self.inference_times):.2f} ms")
-        print(f"Min inference time: {np.min(self.inference_times):.2f} ms")
-        print(f"Std inference time: {np.std(self.inference_times):.2f} ms")
+        stats = self.get_inference_stats()
+        print(f"Average inference time: {stats['mean']:.2f} ms")
+        print(f"Max inference time: {stats['max']:.2f} ms")
+        print(f"Min inference time: {stats['min']:.2f} ms")
+        print(f"Std inference time: {stats['std']:.2f} ms")
         
         # Check performance against requirements
-        avg_time = np.mean(self.inference_times)
+        avg_time = stats['mean']
         if avg_time < 50:
             print(" <50ms inference target: ACHIEVED")
         else:
@@ -164,31 +471,132 @@ class EdgeInferenceSimulator:
         
         # Generate test data
         test_samples = self.generator.generate_real_time_samples(num_iterations)
+        self.reserve_inference_times(num_iterations)
+        
+        if TQDM_AVAILABLE:
+            for sample in tqdm(test_samples, desc=" Benchmark", unit="inf"):
+                self.run_inference(sample)
+        else:
+            for i, sample in enumerate(test_samples):
+                self.run_inference(sample)
+                
+                if (i + 1) % 100 == 0:
+                    print(f"Completed {i+1}/{num_iterations} iterations...")
+        
+        self.print_benchmark_results()
+    
+    def preprocess_sensor_batch(self, sensor_samples):
+        """Preprocess a list of sensor samples into a single (N, 4) batch"""
+        features = np.array([
+            [s['soil_moisture'], s['temperature'], s['humidity'], s['audio_energy']]
+            for s in sensor_samples
+        ], dtype=np.float32).reshape(-1, 4)
+        
+        return self.normalize_features(features, out=features)
+    
+    def normalize_features(self, features, out=None):
+        """Normalize an (N, 4) raw feature array for ML inference"""
+        if out is None:
+            out = np.array(features, dtype=np.float32)
+        
+        out[:, 0] = features[:, 0] / 100.0                 # Normalize to 0-1
+        out[:, 1] = (features[:, 1] - 10) / 40.0           # Normalize 10-50°C to 0-1
+        out[:, 2] = features[:, 2] / 100.0                 # Normalize to 0-1
+                                                           # Audio already 0-1
+        return out
+    
+    def run_batched_inference(self, num_iterations, batch_size=256):
+        """Time inference over generated samples with one model call per batch
+        
+        This always runs the Keras model, even after convert_to_tflite_int8,
+        since the TFLite interpreter is built for single (1, 4) inputs.
+        Returns the generated samples and their (N, 3) predictions.
+        """
+        # Generate and preprocess all test data up front
+        test_samples = self.generator.generate_real_time_samples(num_iterations)
+        features = self.preprocess_sensor_batch(test_samples)
+        predictions = np.empty((num_iterations, 3), dtype=np.float32)
         
-        for i, sample in enumerate(test_samples):
-            result = self.run_inference(sample)
+        self.reserve_inference_times(num_iterations)
+        
+        # Warm up once untimed so the first timed batch does not pay for the
+        # first eager call
+        if num_iterations:
+            self.model(np.zeros((min(batch_size, num_iterations), 4), dtype=np.float32),
+                       training=False)
+        
+        for start in range(0, num_iterations, batch_size):
+            batch = features[start:start + batch_size]
+            
+            start_ns = time.perf_counter_ns()
+            predictions[start:start + batch_size] = self.model(batch, training=False).numpy()
+            batch_ns = time.perf_counter_ns() - start_ns
             
-            if (i + 1) % 100 == 0:
-                print(f"Completed {i+1}/{num_iterations} iterations...")
+            # Attribute an equal share of the batch time to each sample
+            self.record_inference_times(np.full(len(batch), batch_ns // len(batch)))
+        
+        return test_samples, predictions
+    
+    def benchmark_performance_batched(self, num_iterations=1000, batch_size=256):
+        """Run performance benchmarking with one model call per batch"""
+        print(f" Running batched performance benchmark "
+              f"({num_iterations} iterations, batch size {batch_size})...")
+        
+        self.run_batched_inference(num_iterations, batch_size)
+        
+        self.print_benchmark_results()
+    
+    def benchmark_performance_parallel(self, num_iterations=1000, batch_size=256, n_workers=None):
+        """Run the batched benchmark split across worker processes
+        
+        Each worker rebuilds the Keras model (from model_path, or the cached
+        dummy model) and runs run_batched_inference single-threaded, so a
+        TFLite interpreter on this simulator is not used by the workers.
+        """
+        n_workers = n_workers or os.cpu_count()
+        print(f" Running parallel performance benchmark "
+              f"({num_iterations} iterations, {n_workers} workers)...")
+        
+        if num_iterations <= 0:
+            print(" No iterations to run")
+            return
+        
+        chunk_sizes = [len(c) for c in np.array_split(np.arange(num_iterations), n_workers)]
+        chunk_sizes = [size for size in chunk_sizes if size > 0]
+        seeds = [self.seed + i + 1 for i in range(len(chunk_sizes))]
+        
+        # TensorFlow is not fork-safe, so workers are spawned fresh
+        with ProcessPoolExecutor(max_workers=len(chunk_sizes),
+                                 mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_benchmark_worker,
+                                 initargs=(self.model_path, self.seed, batch_size)) as executor:
+            results = executor.map(_run_benchmark_chunk, chunk_sizes, seeds,
+                                   [batch_size] * len(chunk_sizes))
+            
+            self.reserve_inference_times(num_iterations)
+            for times_ns in results:
+                self.record_inference_times(times_ns)
         
         self.print_benchmark_results()
     
     def print_benchmark_results(self):
         """Print detailed benchmark results"""
-        times = np.array(self.inference_times)
+        stats = self.get_inference_stats()
+        # np.percentile selects both ranks in one O(N) partition pass
+        p95, p99 = np.percentile(self.get_inference_times_ms(), [95, 99])
         
         print("\n PERFORMANCE BENCHMARK RESULTS")
         print("=" * 50)
-        print(f"Total inferences: {len(times)}")
-        print(f"Average time: {np.mean(times):.4f} ms")
-        print(f"Standard deviation: {np.std(times):.4f} ms")
-        print(f"Minimum time: {np.min(times):.4f} ms")
-        print(f"Maximum time: {np.max(times):.4f} ms")
-        print(f"95th percentile: {np.percentile(times, 95):.4f} ms")
-        print(f"99th percentile: {np.percentile(times, 99):.4f} ms")
+        print(f"Total inferences: {self.num_inferences}")
+        print(f"Average time: {stats['mean']:.4f} ms")
+        print(f"Standard deviation: {stats['std']:.4f} ms")
+        print(f"Minimum time: {stats['min']:.4f} ms")
+        print(f"Maximum time: {stats['max']:.4f} ms")
+        print(f"95th percentile: {p95:.4f} ms")
+        print(f"99th percentile: {p99:.4f} ms")
         
         # Performance classification
-        avg_time = np.mean(times)
+        avg_time = stats['mean']
         if avg_time < 1:
             rating = "EXCELLENT"
         elif avg_time < 10:
@@ -201,24 +609,52 @@ class EdgeInferenceSimulator:
         print(f"Performance rating: {rating}")
         print("=" * 50)
     
-    def save_simulation_report(self, filename="simulation_report.json"):
-        """Save simulation results to JSON report"""
+    def format_offsets(self, offsets_ns, fmt='%H:%M:%S'):
+        """Convert result timestamp offsets to formatted strings in one vectorized pass"""
+        timestamps = pd.to_datetime(np.asarray(offsets_ns, dtype=np.int64), unit='ns',
+                                    origin=pd.Timestamp(self._start_wall))
+        return timestamps.strftime(fmt).tolist()
+    
+    def offsets_to_iso(self, offsets_ns):
+        """Convert result timestamp offsets to ISO strings in one vectorized pass"""
+        return self.format_offsets(offsets_ns, '%Y-%m-%dT%H:%M:%S.%f')
+    
+    def save_simulation_report(self, filename="simulation_report.json", results=None):
+        """Save simulation results to JSON report
+        
+        If `results` (dicts returned by run_inference or
+        simulate_real_time_operation) are given they are included with their
+        timestamps formatted in bulk.
+        """
+        stats = self.get_inference_stats()
         report = {
             'timestamp': datetime.now().isoformat(),
             'performance_metrics': {
-                'total_inferences': len(self.inference_times),
-                'average_inference_time_ms': float(np.mean(self.inference_times)),
-                'min_inference_time_ms': float(np.min(self.inference_times)),
-                'max_inference_time_ms': float(np.max(self.inference_times)),
-                'std_inference_time_ms': float(np.std(self.inference_times))
+                'total_inferences': self.num_inferences,
+                'average_inference_time_ms': stats['mean'],
+                'min_inference_time_ms': stats['min'],
+                'max_inference_time_ms': stats['max'],
+                'std_inference_time_ms': stats['std']
             },
             'hardware_compatibility': {
                 'target_inference_time_ms': 50,
-                'achieved_inference_time_ms': float(np.mean(self.inference_times)),
-                'meets_requirements': np.mean(self.inference_times) < 50
+                'achieved_inference_time_ms': stats['mean'],
+                'meets_requirements': stats['mean'] < 50
             }
         }
         
+        if results:
+            timestamps = self.offsets_to_iso([r['timestamp_offset_ns'] for r in results])
+            report['inferences'] = [
+                {
+                    'timestamp': ts,
+                    'predicted_class': r['predicted_class'],
+                    'confidence': r['confidence'],
+                    'inference_time_ms': r['inference_time_ms']
+                }
+                for ts, r in zip(timestamps, results)
+            ]
+        
         with open(filename, 'w') as f:
             json.dump(report, f, indent=2)
         
@@ -230,13 +666,14 @@ def main():
     simulator = EdgeInferenceSimulator()
     
     # Run a short real-time simulation
-    simulator.simulate_real_time_operation(duration_minutes=2, sample_interval_sec=5)
+    results = simulator.simulate_real_time_operation(duration_minutes=2, sample_interval_sec=5,
+                                                     verbose=2)
     
     # Run performance benchmark
     simulator.benchmark_performance(num_iterations=100)
     
     # Save report
-    simulator.save_simulation_report()
+    simulator.save_simulation_report(results=results)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,49 @@
+"""Tests for EdgeInferenceSimulator inference-time bookkeeping"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("tensorflow")
+
+from edge_simulator import EdgeInferenceSimulator
+
+
+def make_bare_simulator(capacity=4):
+    """Simulator with timing storage only, skipping model creation"""
+    simulator = EdgeInferenceSimulator.__new__(EdgeInferenceSimulator)
+    simulator.inference_times = np.empty(capacity, dtype=np.int64)
+    simulator.reset_inference_times()
+    return simulator
+
+
+def test_running_stats_match_numpy_for_mixed_records():
+    simulator = make_bare_simulator()
+    rng = np.random.default_rng(0)
+    
+    for value in rng.integers(10_000, 2_000_000, 25):
+        simulator.record_inference_time(int(value))
+    simulator.record_inference_times(rng.integers(10_000, 2_000_000, 300))
+    simulator.record_inference_times(np.array([], dtype=np.int64))
+    for value in rng.integers(10_000, 2_000_000, 10):
+        simulator.record_inference_time(int(value))
+    simulator.record_inference_times(np.full(7, 123_456))
+    
+    times = simulator.get_inference_times_ms()
+    stats = simulator.get_inference_stats()
+    
+    assert simulator.num_inferences == len(times) == 342
+    assert stats['mean'] == pytest.approx(np.mean(times))
+    assert stats['std'] == pytest.approx(np.std(times))
+    assert stats['min'] == pytest.approx(times.min())
+    assert stats['max'] == pytest.approx(times.max())
+
+
+def test_reset_clears_running_stats():
+    simulator = make_bare_simulator()
+    simulator.record_inference_times(np.array([1_000, 2_000, 3_000]))
+    simulator.reset_inference_times()
+    simulator.record_inference_time(5_000_000)
+    
+    stats = simulator.get_inference_stats()
+    assert simulator.num_inferences == 1
+    assert stats == {'mean': 5.0, 'std': 0.0, 'min': 5.0, 'max': 5.0}